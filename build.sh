@@ -137,12 +137,18 @@ if [ ! -z "${ASAN_BUILD}" ]; then
     fi
     rm test_output.tmp
 else
+    # TEST_WORKERS can be used to spread the tests over several pytest-xdist workers (e.g. "auto").
+    # Every test starts its own server, so tests do not share keys across workers.
+    PYTEST_WORKER_ARGS=""
+    if [[ -n "$TEST_WORKERS" ]]; then
+        PYTEST_WORKER_ARGS="-n $TEST_WORKERS"
+    fi
     # TEST_PATTERN can be used to run specific tests or test patterns.
     if [[ -n "$TEST_PATTERN" ]]; then
-        python3 -m pytest --cache-clear -v "$SCRIPT_DIR/tests/" -k $TEST_PATTERN
+        python3 -m pytest --cache-clear -v $PYTEST_WORKER_ARGS "$SCRIPT_DIR/tests/" -k $TEST_PATTERN
     else
         echo "TEST_PATTERN is not set. Running all integration tests."
-        python3 -m pytest --cache-clear -v "$SCRIPT_DIR/tests/"
+        python3 -m pytest --cache-clear -v $PYTEST_WORKER_ARGS "$SCRIPT_DIR/tests/"
     fi
 fi
 
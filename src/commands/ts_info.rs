@@ -1,3 +1,6 @@
+use crate::commands::command_parser::{
+    CommandArgToken, advance_if_next_token_one_of, parse_count_arg,
+};
 use crate::common::constants::META_KEY_LABEL;
 use crate::common::rounding::RoundingStrategy;
 use crate::series::index::get_timeseries_index;
@@ -13,7 +16,7 @@ use valkey_module::redisvalue::ValkeyValueKey;
 use valkey_module::{AclPermissions, Context, NextArg, ValkeyResult, ValkeyString, ValkeyValue};
 
 pub fn ts_info_cmd(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
-    let mut args = args.into_iter().skip(1);
+    let mut args = args.into_iter().skip(1).peekable();
     let key = args.next_arg()?;
 
     let debugging = if let Ok(val) = args.next_str() {
@@ -22,17 +25,28 @@ pub fn ts_info_cmd(ctx: &Context, args: Vec<ValkeyString>) -> ValkeyResult {
         false
     };
 
+    // DEBUG COUNT n: only report the first n chunks, so callers that need just the head
+    // do not pay for serializing every chunk of a large series
+    let chunk_limit = if debugging
+        && advance_if_next_token_one_of(&mut args, &[CommandArgToken::Count]).is_some()
+    {
+        Some(parse_count_arg(&mut args)?)
+    } else {
+        None
+    };
+
     args.done()?;
     let series = get_timeseries(ctx, &key, Some(AclPermissions::ACCESS), true)?;
     // must_exist was passed above. Therefore, unwrap is safe here
     let series = series.unwrap();
-    Ok(get_ts_info(ctx, &series, debugging, None))
+    Ok(get_ts_info(ctx, &series, debugging, chunk_limit, None))
 }
 
 fn get_ts_info(
     ctx: &Context,
     ts: &TimeSeries,
     debug: bool,
+    chunk_limit: Option<usize>,
     key: Option<&ValkeyString>,
 ) -> ValkeyValue {
     let mut map: HashMap<ValkeyValueKey, ValkeyValue> = HashMap::with_capacity(ts.labels.len() + 1);
@@ -144,16 +158,17 @@ fn get_ts_info(
     if debug {
         map.insert("keySelfName".into(), ValkeyValue::from(key));
         // yes, I know its title case, but that's what redis does
-        map.insert("Chunks".into(), get_chunks_info(ts));
+        map.insert("Chunks".into(), get_chunks_info(ts, chunk_limit));
     }
 
     ValkeyValue::Map(map)
 }
 
-fn get_chunks_info(ts: &TimeSeries) -> ValkeyValue {
+fn get_chunks_info(ts: &TimeSeries, limit: Option<usize>) -> ValkeyValue {
     let items = ts
         .chunks
         .iter()
+        .take(limit.unwrap_or(usize::MAX))
         .map(get_one_chunk_info)
         .collect::<Vec<ValkeyValue>>();
 
@@ -177,8 +177,7 @@ class TestTimeseriesDumpRestore(ValkeyTimeSeriesTestCaseBase):
         assert restored_dest_info['totalSamples'] == original_dest_info['totalSamples']
 
         # Check sourceKey is preserved
-        if 'sourceKey' in original_dest_info:
-            assert restored_dest_info.get('sourceKey') == original_dest_info['sourceKey']
+        assert restored_dest_info['sourceKey'] == original_dest_info['sourceKey']
 
         # Validate aggregated data
         assert len(restored_dest_range) == len(original_dest_range)
@@ -18,6 +18,10 @@ SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 SERVER_VERSION = os.environ.get("SERVER_VERSION", "unstable")
 VALKEY_SERVER_PATH = f"{SCRIPT_DIR}/build/binaries/{SERVER_VERSION}/valkey-server"
 TEST_DIR = f"{ROOT_PATH}/test-data"
+# Under pytest-xdist, give each worker its own data directory: server directories are named after the
+# test, and test names repeat across modules (e.g. the standalone and cluster QUERYINDEX tests)
+if "PYTEST_XDIST_WORKER" in os.environ:
+    TEST_DIR = f"{TEST_DIR}/{os.environ['PYTEST_XDIST_WORKER']}"
 LOGS_DIR = f"{TEST_DIR}/logs"
 
 if "VALKEY_SERVER_PATH" in os.environ:
@@ -134,6 +138,10 @@ def parse_info_response(response):
             info_dict[key_str] = value.decode('utf-8')
         else:
             info_dict[key_str] = value
+
+    # Normalize optional fields once, so callers don't need membership checks
+    info_dict.setdefault('rules', [])
+    info_dict.setdefault('sourceKey', None)
     return info_dict
 
 
@@ -76,7 +76,6 @@ class TestDel(ValkeyTimeSeriesTestCaseBase):
 
         # Verify compaction rules exist on parent
         parent_info = self.ts_info(parent_key)
-        assert 'rules' in parent_info
         assert len(parent_info['rules']) == 2
 
         # Verify compacted data exists in destination series
@@ -201,6 +200,5 @@ class TestDel(ValkeyTimeSeriesTestCaseBase):
 
         # Verify the compaction rule still exists between level1 and level2
         level1_info = self.ts_info(level1_key)
-        assert 'rules' in level1_info
         assert len(level1_info['rules']) == 1
         assert level1_info['rules'][0].dest_key == level2_key
@@ -7,14 +7,21 @@ from valkey_timeseries_test_case import ValkeyTimeSeriesTestCaseBase
 class TestFlushDb(ValkeyTimeSeriesTestCaseBase):
     """Test cases for server event handling in the TimeSeries module."""
 
-    def create_ts(self, key, timestamp=None, value=1.0):
-        """Helper to create a time series with a sample data point."""
+    def create_ts(self, key, timestamp=None, value=1.0, pipe=None):
+        """Helper to create a time series with a sample data point. If a pipeline is given, the commands
+        are queued on it and the caller executes it.
+        """
 
         if timestamp is None:
             timestamp = 1000
 
-        self.client.execute_command("TS.CREATE", key, "LABELS", "key", key, "sensor", "temp")
-        self.client.execute_command("TS.ADD", key, timestamp, value)
+        owned = pipe is None
+        if owned:
+            pipe = self.pipe()
+        pipe.execute_command("TS.CREATE", key, "LABELS", "key", key, "sensor", "temp")
+        pipe.execute_command("TS.ADD", key, timestamp, value)
+        if owned:
+            pipe.execute()
         return key
 
     def test_flushdb_event(self):
@@ -22,33 +29,33 @@ class TestFlushDb(ValkeyTimeSeriesTestCaseBase):
 
         # Create multiple keys
         start_ts = 5000
-        keys = ["ts:flush1", "ts:flush2", "ts:flush3"]
-        for i, key in enumerate(keys):
-            self.create_ts(key, start_ts + (i * 10), float(i))
+        src_keys = ["ts:flush1", "ts:flush2", "ts:flush3"]
+        with self.pipe() as pipe:
+            for i, key in enumerate(src_keys):
+                self.create_ts(key, start_ts + (i * 10), float(i), pipe)
+            pipe.execute()
 
         # All keys should exist
-        for key in keys:
-            assert self.client.exists(key)
+        assert self.client.exists(*src_keys) == 3
 
-        keys = self.client.execute_command("TS.QUERYINDEX", 'sensor=temp')
-        assert len(keys) == 3
+        idx_keys = self.client.execute_command("TS.QUERYINDEX", 'sensor=temp')
+        assert len(idx_keys) == 3
 
         # Flush the database
         self.client.flushdb()
 
         # No keys should exist
-        for key in keys:
-            assert not self.client.exists(key)
+        assert self.client.exists(*src_keys) == 0
 
         all_keys = self.client.execute_command("KEYS", "ts:*")
         assert len(all_keys) == 0, "All keys should be flushed"
 
         # the index should be empty
-        keys = self.client.execute_command("TS.QUERYINDEX", 'key=~"ts:flush*"')
-        assert len(keys) == 0
+        idx_keys = self.client.execute_command("TS.QUERYINDEX", 'key=~"ts:flush*"')
+        assert len(idx_keys) == 0
 
-        keys = self.client.execute_command("TS.QUERYINDEX", 'sensor="temp"')
-        assert len(keys) == 0
+        idx_keys = self.client.execute_command("TS.QUERYINDEX", 'sensor="temp"')
+        assert len(idx_keys) == 0
 
         # Create a new key - should work without index interference
         new_key = "ts:new"
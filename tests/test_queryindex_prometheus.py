@@ -5,142 +5,143 @@ from valkeytestframework.conftest import resource_port_tracker
 from valkey_timeseries_test_case import ValkeyTimeSeriesTestCaseBase
 
 
+# Expected key sets shared by several cases. Replies are compared as sets, since the order of
+# TS.QUERYINDEX results is not part of what these tests check
+ALL_SERIES = frozenset({b'ts1', b'ts2', b'ts3', b'ts4', b'ts5', b'ts6', b'ts7', b'ts8'})
+N_IS_1 = frozenset({b'ts1', b'ts2', b'ts3', b'ts4'})
+HAS_I = frozenset({b'ts2', b'ts3', b'ts4', b'ts7'})
+NO_SERIES = frozenset()
+
+
 class TestTsQueryIndex(ValkeyTimeSeriesTestCaseBase):
     """
     Test cases for TS.QUERYINDEX command with Prometheus matching semantics. Based on the tests
     used by the Prometheus project for their label matching logic.
     """
 
-    def setup_test_data(self, client):
+    @pytest.fixture(autouse=True)
+    def setup_test_data(self, setup_test):
         """Create a set of time series with different label combinations for testing"""
-        # Create test series with various labels
-        client.execute_command('TS.CREATE', 'ts1', 'LABELS', 'n', '1')
-        client.execute_command('TS.CREATE', 'ts2', 'LABELS', 'n', '1', 'i', 'a')
-        client.execute_command('TS.CREATE', 'ts3', 'LABELS', 'n', '1', 'i', 'b')
-        client.execute_command('TS.CREATE', 'ts4', 'LABELS', 'n', '1', 'i', '\n')
-        client.execute_command('TS.CREATE', 'ts5', 'LABELS', 'n', '2')
-        client.execute_command('TS.CREATE', 'ts6', 'LABELS', 'n', '2.5')
-        client.execute_command('TS.CREATE', 'ts7', 'LABELS', 'i', 'c')
-        client.execute_command('TS.CREATE', 'ts8', 'LABELS', 'complex', 'val1&val2')
-
-    def test_basic_equal_matching(self):
-        """Test simple equality matching of TS.QUERYINDEX"""
-        self.setup_test_data(self.client)
-
+        with self.pipe() as pipe:
+            # Create test series with various labels
+            pipe.execute_command('TS.CREATE', 'ts1', 'LABELS', 'n', '1')
+            pipe.execute_command('TS.CREATE', 'ts2', 'LABELS', 'n', '1', 'i', 'a')
+            pipe.execute_command('TS.CREATE', 'ts3', 'LABELS', 'n', '1', 'i', 'b')
+            pipe.execute_command('TS.CREATE', 'ts4', 'LABELS', 'n', '1', 'i', '\n')
+            pipe.execute_command('TS.CREATE', 'ts5', 'LABELS', 'n', '2')
+            pipe.execute_command('TS.CREATE', 'ts6', 'LABELS', 'n', '2.5')
+            pipe.execute_command('TS.CREATE', 'ts7', 'LABELS', 'i', 'c')
+            pipe.execute_command('TS.CREATE', 'ts8', 'LABELS', 'complex', 'val1&val2')
+            pipe.execute()
+
+    def assert_query_cases(self, cases):
+        """Run every (filters, expected) case as a TS.QUERYINDEX in a single pipelined round-trip and
+        compare the reply against the expected set of keys.
+        """
+        with self.pipe() as pipe:
+            for filters, _ in cases:
+                pipe.execute_command('TS.QUERYINDEX', *filters)
+            results = pipe.execute()
+
+        for (filters, expected), result in zip(cases, results):
+            # The length check keeps duplicate keys in a reply from passing the set comparison
+            assert len(result) == len(expected) and set(result) == expected, f"TS.QUERYINDEX {' '.join(filters)!r}"
+
+    BASIC_EQUAL_CASES = (
         # Basic filter matching all 'n=1' series
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n="1"'))
-        assert result == [b'ts1', b'ts2', b'ts3', b'ts4']
-
+        (('n="1"',), N_IS_1),
         # Match specific label combination
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n="1"', 'i=a'))
-        assert result == [b'ts2']
-
+        (('n="1"', 'i=a'), {b'ts2'}),
         # Non-existent value
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=nonexistent'))
-        assert result == []
+        (('n=nonexistent',), NO_SERIES),
+    )
 
-    def test_empty_label_filtering(self):
-        """Test filtering for series with or without specific labels"""
-        self.setup_test_data(self.client)
+    def test_basic_equal_matching(self):
+        """Test simple equality matching of TS.QUERYINDEX"""
+        self.assert_query_cases(self.BASIC_EQUAL_CASES)
 
+    EMPTY_LABEL_CASES = (
         # Find series without 'i' label
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'i='))
-        assert result == [b'ts1', b'ts5', b'ts6', b'ts8']
-
+        (('i=',), {b'ts1', b'ts5', b'ts6', b'ts8'}),
         # Find series with 'i' label
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'i=~".+"'))
-        assert result == [b'ts2', b'ts3', b'ts4', b'ts7']
+        (('i=~".+"',), HAS_I),
+    )
 
-    def test_not_equal_matching(self):
-        """Test negation matching with TS.QUERYINDEX"""
-        self.setup_test_data(self.client)
+    def test_empty_label_filtering(self):
+        """Test filtering for series with or without specific labels"""
+        self.assert_query_cases(self.EMPTY_LABEL_CASES)
 
+    NOT_EQUAL_CASES = (
         # Not equal to n=1
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n!=1'))
-        assert result == [b'ts5', b'ts6', b'ts7', b'ts8']
-
+        (('n!=1',), {b'ts5', b'ts6', b'ts7', b'ts8'}),
         # Combine equality and negation
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=1', 'i!=a'))
-        assert result == [b'ts1', b'ts3', b'ts4']
-
+        (('n=1', 'i!=a'), {b'ts1', b'ts3', b'ts4'}),
         # Negation of empty value (finds all with the label set)
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'i!='))
-        assert result == [b'ts2', b'ts3', b'ts4', b'ts7']
+        (('i!=',), HAS_I),
+    )
 
-    def test_regex_matching(self):
-        """Test regex matching capabilities of TS.QUERYINDEX"""
-        self.setup_test_data(self.client)
+    def test_not_equal_matching(self):
+        """Test negation matching with TS.QUERYINDEX"""
+        self.assert_query_cases(self.NOT_EQUAL_CASES)
 
+    REGEX_CASES = (
         # Match with regex pattern
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=~"^1$"'))
-        assert result == [b'ts1', b'ts2', b'ts3', b'ts4']
-
+        (('n=~"^1$"',), N_IS_1),
         # Match with OR pattern
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=~"1|2"'))
-        assert result == [b'ts1', b'ts2', b'ts3', b'ts4', b'ts5']
-
+        (('n=~"1|2"',), {b'ts1', b'ts2', b'ts3', b'ts4', b'ts5'}),
         # Match all with .* pattern
         # NOTE: Prometheus has a **cough** interesting behavior where `.*` matches all series
         # regardless of whether they have the label or not. So paradoxically, this matches all series.
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=~".*"'))
-        assert len(result) == 8  # All series with label 'n'
-
+        (('n=~".*"',), ALL_SERIES),
         # Match non-empty values with .+
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'i=~".+"'))
-        assert result == [b'ts2', b'ts3', b'ts4', b'ts7']
+        (('i=~".+"',), HAS_I),
+    )
 
-    def test_regex_not_matching(self):
-        """Test regex negation matching of TS.QUERYINDEX"""
-        self.setup_test_data(self.client)
+    def test_regex_matching(self):
+        """Test regex matching capabilities of TS.QUERYINDEX"""
+        self.assert_query_cases(self.REGEX_CASES)
 
+    REGEX_NOT_CASES = (
         # Not matching regex
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n!~"^1$"'))
-        assert result == [b'ts5', b'ts6', b'ts7', b'ts8']
-
+        (('n!~"^1$"',), {b'ts5', b'ts6', b'ts7', b'ts8'}),
         # Not matching OR pattern
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n!~"1|2"'))
-        assert result == [b'ts6', b'ts7', b'ts8']
-
+        (('n!~"1|2"',), {b'ts6', b'ts7', b'ts8'}),
         # Not matching anything (should return empty set)
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n!~".*"'))
-        assert result == []
+        (('n!~".*"',), NO_SERIES),
+    )
 
-    def test_complex_combinations(self):
-        """Test more complex query combinations"""
-        self.setup_test_data(self.client)
+    def test_regex_not_matching(self):
+        """Test regex negation matching of TS.QUERYINDEX"""
+        self.assert_query_cases(self.REGEX_NOT_CASES)
 
+    COMPLEX_CASES = (
         # Combination of equals, not equals and regex
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=1', 'i!=a', 'i=~".*"'))
-        assert result == [b'ts1', b'ts3', b'ts4']
-
+        (('n=1', 'i!=a', 'i=~".*"'), {b'ts1', b'ts3', b'ts4'}),
         # Using multiple mutually exclusive conditions
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=1', 'n=2'))
-        assert result == []
-
+        (('n=1', 'n=2'), NO_SERIES),
         # Complex regex pattern
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=~"^[12].*$"'))
-        assert result == [b'ts1', b'ts2', b'ts3', b'ts4', b'ts5', b'ts6']
+        (('n=~"^[12].*$"',), {b'ts1', b'ts2', b'ts3', b'ts4', b'ts5', b'ts6'}),
+    )
 
-    def test_special_characters(self):
-        """Test handling of special characters in labels and values"""
-        self.setup_test_data(self.client)
+    def test_complex_combinations(self):
+        """Test more complex query combinations"""
+        self.assert_query_cases(self.COMPLEX_CASES)
 
+    SPECIAL_CHARACTER_CASES = (
         # Match newline character
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'i="\n"'))
-        assert result == [b'ts4']
-
+        (('i="\n"',), {b'ts4'}),
         # Match with regex for a special character
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'i=~"\\n"'))
-        assert result == [b'ts4']
-
+        (('i=~"\\n"',), {b'ts4'}),
         # Match ampersand in value
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'complex="val1&val2"'))
-        assert result == [b'ts8']
+        (('complex="val1&val2"',), {b'ts8'}),
+    )
+
+    def test_special_characters(self):
+        """Test handling of special characters in labels and values"""
+        self.assert_query_cases(self.SPECIAL_CHARACTER_CASES)
 
     def test_error_cases(self):
         """Test error conditions with TS.QUERYINDEX"""
-        self.setup_test_data(self.client)
-
         # Empty query should return error
         with pytest.raises(ResponseError, match="wrong number of arguments for 'TS.QUERYINDEX' command"):
             self.client.execute_command('TS.QUERYINDEX')
@@ -156,56 +157,45 @@ class TestTsQueryIndex(ValkeyTimeSeriesTestCaseBase):
 
         assert "parse error: unexpected token \"[\"" in str(execInfo.value)
 
-    def test_empty_result_cases(self):
-        """Test cases that should return empty results"""
-        self.setup_test_data(self.client)
-
+    EMPTY_RESULT_CASES = (
         # Non-existent label value
-        result = self.client.execute_command('TS.QUERYINDEX', 'n=nonexistent')
-        assert result == []
-
+        (('n=nonexistent',), NO_SERIES),
         # Impossible combination
-        result = self.client.execute_command('TS.QUERYINDEX', 'n=1', 'n=2')
-        assert result == []
-
+        (('n=1', 'n=2'), NO_SERIES),
         # Combination of regex patterns that can't be satisfied
-        result = self.client.execute_command('TS.QUERYINDEX', 'i=~"a.*"', 'i=~"b.*"')
-        assert result == []
+        (('i=~"a.*"', 'i=~"b.*"'), NO_SERIES),
+    )
 
-    def test_query_with_multiple_filters(self):
-        """Test multiple filter queries in a single command"""
-        self.setup_test_data(self.client)
+    def test_empty_result_cases(self):
+        """Test cases that should return empty results"""
+        self.assert_query_cases(self.EMPTY_RESULT_CASES)
 
+    MULTIPLE_FILTER_CASES = (
         # Using multiple independent filters
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=1', 'i=a'))
-        assert result == [b'ts2']
-
+        (('n=1', 'i=a'), {b'ts2'}),
         # Multiple filters with regex
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=~"^[12]$"', 'i=~"[ab]"'))
-        assert result == [b'ts2', b'ts3']
-
+        (('n=~"^[12]$"', 'i=~"[ab]"'), {b'ts2', b'ts3'}),
         # Multiple filters with negation
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=1', 'i!=', 'i!=a'))
-        assert result == [b'ts3', b'ts4']
+        (('n=1', 'i!=', 'i!=a'), {b'ts3', b'ts4'}),
+    )
 
-    def test_match_all_patterns(self):
-        """Test special patterns that match all or none"""
-        self.setup_test_data(self.client)
+    def test_query_with_multiple_filters(self):
+        """Test multiple filter queries in a single command"""
+        self.assert_query_cases(self.MULTIPLE_FILTER_CASES)
 
+    MATCH_ALL_CASES = (
         # Match all series with a wildcard
         # NOTE: Prometheus has a **cough** interesting behavior where `.*` matches all series
         # regardless of whether they have the label or not. So paradoxically, this matches all series.
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=~".*"'))
-        assert len(result) == 8  # All series
-
+        (('n=~".*"',), ALL_SERIES),
         # Match all and filter with another condition
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n=~".*"', 'i=a'))
-        assert result == [b'ts2']
-
+        (('n=~".*"', 'i=a'), {b'ts2'}),
         # Using .+ to match non-empty values only
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'i=~".+"'))
-        assert result == [b'ts2', b'ts3', b'ts4', b'ts7']
+        (('i=~".+"',), HAS_I),
+        # Not matching anything: no series can satisfy this
+        (('n!~".*"', 'i!~".*"'), NO_SERIES),
+    )
 
-        # Not matching anything
-        result = sorted(self.client.execute_command('TS.QUERYINDEX', 'n!~".*"', 'i!~".*"'))
-        assert result == []  # No series can satisfy this
\ No newline at end of file
+    def test_match_all_patterns(self):
+        """Test special patterns that match all or none"""
+        self.assert_query_cases(self.MATCH_ALL_CASES)
@@ -1,5 +1,3 @@
-import time
-
 from valkeytestframework.conftest import resource_port_tracker
 from valkeytestframework.util.waiters import *
 
@@ -9,17 +7,23 @@ from valkey_timeseries_test_case import ValkeyTimeSeriesTestCaseBase
 class TestServerEvents(ValkeyTimeSeriesTestCaseBase):
     """Test cases for server event handling in the TimeSeries module."""
 
-    def setup_data(self):
-        self.start_ts = 1577836800  # 2020-01-01 00:00:00
+    start_ts = 1577836800  # 2020-01-01 00:00:00
 
-    def create_ts(self, key, timestamp=None, value=1.0):
-        """Helper to create a time series with a sample data point."""
+    def create_ts(self, key, timestamp=None, value=1.0, pipe=None):
+        """Helper to create a time series with a sample data point. If a pipeline is given, the commands
+        are queued on it and the caller executes it.
+        """
 
         if timestamp is None:
             timestamp = 1000
 
-        self.client.execute_command("TS.CREATE", key, "LABELS", "key", key, "sensor", "temp")
-        self.client.execute_command("TS.ADD", key, timestamp, value)
+        owned = pipe is None
+        if owned:
+            pipe = self.pipe()
+        pipe.execute_command("TS.CREATE", key, "LABELS", "key", key, "sensor", "temp")
+        pipe.execute_command("TS.ADD", key, timestamp, value)
+        if owned:
+            pipe.execute()
         return key
 
     def test_loaded_event(self):
@@ -28,8 +32,7 @@ class TestServerEvents(ValkeyTimeSeriesTestCaseBase):
         key = "ts:loaded"
         self.client.execute_command("TS.CREATE", key, "LABELS", "__name__", "sensor", "sensor", "temp")
 
-        # Save and reload to trigger load events
-        self.client.save()
+        # DEBUG RELOAD saves the dataset and loads it back, triggering load events
         self.client.execute_command("DEBUG", "RELOAD")
 
         # Verify the key exists and is queryable
@@ -73,13 +76,11 @@ class TestServerEvents(ValkeyTimeSeriesTestCaseBase):
     def test_expire_event(self):
         """Test that an expired series is removed from the index."""
 
-        self.setup_data()
-
         key = "ts:expire"
         self.create_ts(key)
 
-        # Set the key to expire in 1 second
-        self.client.expire(key, 1)
+        # Set the key to expire in 100 milliseconds
+        self.client.pexpire(key, 100)
 
         # Wait for the key to expire using the test framework waiter instead of sleep
         wait_for_true(lambda: not self.client.exists(key), timeout=TEST_MAX_WAIT_TIME_SECONDS)
@@ -102,12 +103,12 @@ class TestServerEvents(ValkeyTimeSeriesTestCaseBase):
     def test_concurrent_events(self):
         """Test handling of concurrent server events."""
 
-        self.setup_data()
-
         # Create multiple keys
         keys = ["ts:concurrent1", "ts:concurrent2", "ts:concurrent3"]
-        for i, key in enumerate(keys):
-            self.create_ts(key, self.start_ts + i, float(i))
+        with self.pipe() as pipe:
+            for i, key in enumerate(keys):
+                self.create_ts(key, self.start_ts + i, float(i), pipe)
+            pipe.execute()
 
         # Perform multiple operations in quick succession
         # 1. Rename the first key
@@ -120,19 +121,14 @@ class TestServerEvents(ValkeyTimeSeriesTestCaseBase):
         # 3. Delete the third key
         self.client.delete(keys[2])
 
-        # Verify the state after all operations
+        # Verify the state after all operations: none of the original keys is left in db 0
+        assert self.client.exists(*keys) == 0
+        assert self.client.exists("ts:renamed")
 
-        assert not self.client.exists(keys[0])
-        exists = self.client.exists("ts:renamed")
-        assert exists
-
-        assert not self.client.exists(keys[1])
         self.client.select(1)
         assert self.client.exists(keys[1])
         self.client.select(0)
 
-        assert not self.client.exists(keys[2])
-
         # All remaining keys should be queryable
         result = self.client.execute_command("TS.RANGE", "ts:renamed", 0, "+")
         assert len(result) == 1
@@ -27,7 +27,6 @@ class TestTSCreateRule(ValkeyTimeSeriesTestCaseBase):
     def validate_rule_info(self, source_key: str, expected) -> None:
         # Verify rule was created by checking TS.INFO
         info = self.ts_info(source_key)
-        assert "rules" in info
         assert len(info["rules"]) == 1
         rule = info["rules"][0]
         assert expected, rule
@@ -35,7 +34,6 @@ class TestTSCreateRule(ValkeyTimeSeriesTestCaseBase):
     def validate_rules_info(self, source_key: str, expected_rules: List[tuple]) -> None:
         """Helper to validate the rules info for a source key"""
         info = self.ts_info(source_key)
-        assert "rules" in info
         rules = info["rules"]
         assert len(rules) == len(expected_rules), f"Expected {len(expected_rules)} rules, got {len(rules)}"
         for i, actual in rules:
@@ -161,7 +161,7 @@ class TestTSDeleteRule(ValkeyTimeSeriesTestCaseBase):
 
         # Verify dest1 src_series is cleared but dest2 is not
         dest1_info = self.ts_info(dest1_key)
-        assert "sourceKey" not in dest1_info or dest1_info["sourceKey"] is None
+        assert dest1_info["sourceKey"] is None
 
         dest2_info = self.ts_info(dest2_key)
         assert dest2_info["sourceKey"] == source_key
@@ -64,7 +64,6 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
 
         info = self.ts_info(key, True)
         labels = info['labels']
-        print(info)
 
         assert info['totalSamples'] == 0
         assert info['memoryUsage'] > 0  # Metadata still uses memory
@@ -96,18 +95,28 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
         chunk_size = 128  # Use a smaller chunk size for easier testing
         self.client.execute_command('TS.CREATE', key, 'CHUNK_SIZE', chunk_size)
 
-        # Add enough samples to potentially create more than one chunk
-        for i in range(int(chunk_size * 1.5)):
-            self.client.execute_command('TS.ADD', key, 1000 + i * 10, i)
+        # Add enough samples to span several chunks
+        args = ['TS.MADD']
+        for i in range(1000):
+            args.extend([key, 1000 + i * 10, i])
+        self.client.execute_command(*args)
 
         info = self.ts_info(key, True)
 
         assert 'chunks' in info
         assert isinstance(info['chunks'], list)
-        assert len(info['chunks']) >= 1  # Should have at least one chunk
+        assert info['chunkCount'] > 1
+        assert len(info['chunks']) == info['chunkCount']
+        chunk_count = info['chunkCount']
+        first_chunk = info['chunks'][0]
+
+        # COUNT 1 reports just the first chunk of the full listing
+        info = self.ts_info(key, True, chunk_count=1)
+        assert info['chunks'] == [first_chunk]
+        # COUNT only truncates the chunk list, the total is still reported
+        assert info['chunkCount'] == chunk_count
 
         # Check details of the first chunk (keys might vary slightly)
-        first_chunk = info['chunks'][0]
         assert 'startTimestamp' in first_chunk
         assert 'endTimestamp' in first_chunk
         assert 'samples' in first_chunk
@@ -115,6 +124,31 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
         assert first_chunk['samples'] > 0
         assert first_chunk['size'] > 0
 
+    def test_info_debug_count_zero(self):
+        """Test TS.INFO DEBUG COUNT 0 reports no chunks"""
+        key = 'ts_debug_zero'
+        self.client.execute_command('TS.CREATE', key)
+        self.client.execute_command('TS.ADD', key, 1000, 1)
+
+        info = self.ts_info(key, True, chunk_count=0)
+        assert info['chunks'] == []
+        assert info['chunkCount'] == 1
+
+    @pytest.mark.parametrize("args,expected_err", [
+        # COUNT is only accepted after DEBUG
+        (['COUNT', 1], "wrong number of arguments"),
+        (['DEBUG', 'COUNT'], "TSDB: missing COUNT value"),
+        (['DEBUG', 'COUNT', -1], "TSDB: COUNT should be a positive number"),
+        (['DEBUG', 'COUNT', 'abc'], "TSDB: COUNT should be a positive number"),
+    ])
+    def test_info_debug_count_errors(self, args, expected_err):
+        """Test TS.INFO DEBUG COUNT argument errors"""
+        key = 'ts_debug_errors'
+        self.client.execute_command('TS.CREATE', key)
+
+        with pytest.raises(ResponseError, match=expected_err):
+            self.client.execute_command('TS.INFO', key, *args)
+
     def test_info_reflects_single_rule_creation(self):
         """Test that TS.INFO shows rules after TS.CREATERULE"""
         source_key = 'ts_source'
@@ -127,8 +161,8 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
         # Verify no rules initially
         source_info = self.ts_info(source_key, True)
         dest_info = self.ts_info(dest_key, True)
-        assert 'rules' not in source_info or len(source_info['rules']) == 0
-        assert 'sourceKey' not in dest_info
+        assert source_info['rules'] == []
+        assert dest_info['sourceKey'] is None
 
         # Create a compaction rule
         self.client.execute_command(
@@ -138,7 +172,6 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
 
         # Verify rule appears in source TS.INFO
         source_info = self.ts_info(source_key, True)
-        assert 'rules' in source_info
         assert len(source_info['rules']) == 1
 
         rule = source_info['rules'][0]
@@ -148,7 +181,6 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
 
         # Verify destination shows source key
         dest_info = self.ts_info(dest_key, True)
-        assert 'sourceKey' in dest_info
         assert dest_info['sourceKey'] == source_key
 
     def test_info_reflects_various_rule_aggregation_types(self):
@@ -170,29 +202,28 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
             ('var.s', 'ts_vars')
         ]
 
-        # Create a source series
-        self.client.execute_command('TS.CREATE', source_key)
+        with self.pipe() as pipe:
+            # Create a source series
+            pipe.execute_command('TS.CREATE', source_key)
 
-        # Create destination series and rules
-        for agg_type, dest_key in aggregations:
-            self.client.execute_command('TS.CREATE', dest_key)
-            self.client.execute_command(
-                'TS.CREATERULE', source_key, dest_key,
-                'AGGREGATION', agg_type, '60000', align_ts
-            )
+            # Create destination series and rules
+            for agg_type, dest_key in aggregations:
+                pipe.execute_command('TS.CREATE', dest_key)
+                pipe.execute_command(
+                    'TS.CREATERULE', source_key, dest_key,
+                    'AGGREGATION', agg_type, '60000', align_ts
+                )
+            pipe.execute()
 
         # Verify all aggregation types appear correctly
         source_info = self.ts_info(source_key, True)
-        assert 'rules' in source_info
         rules = source_info['rules']
         assert len(rules) == len(aggregations)
-        print(rules)
 
+        agg_map = dict(aggregations)
         for rule in rules:
-            aggr = list(filter(lambda item: item[0] == rule.aggregation, aggregations))
-            assert len(aggr) == 1
-            dest_key = aggr[0][1]
-            assert rule.dest_key == dest_key
+            assert rule.aggregation in agg_map
+            assert rule.dest_key == agg_map[rule.aggregation]
             assert rule.alignment == align_ts
             assert rule.bucket_duration == 60000
 
@@ -211,11 +242,9 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
 
         # Verify rule exists
         source_info = self.ts_info(source_key, True)
-        assert 'rules' in source_info
         assert len(source_info['rules']) == 1
 
         dest_info = self.ts_info(dest_key, True)
-        assert 'sourceKey' in dest_info
         assert dest_info['sourceKey'] == source_key
 
         # Delete the rule
@@ -223,8 +252,8 @@ class TestTimeseriesInfo(ValkeyTimeSeriesTestCaseBase):
 
         # Verify rule is removed from source
         source_info = self.ts_info(source_key, True)
-        assert 'rules' not in source_info or len(source_info['rules']) == 0
+        assert source_info['rules'] == []
 
         # Verify source reference is removed from destination
         dest_info = self.ts_info(dest_key, True)
-        assert 'sourceKey' not in dest_info
+        assert dest_info['sourceKey'] is None
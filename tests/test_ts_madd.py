@@ -1,3 +1,4 @@
+import itertools
 import pytest
 from valkey import ResponseError
 from valkeytestframework.util.waiters import *
@@ -28,9 +29,9 @@ class TestTsMadd(ValkeyTimeSeriesTestCaseBase):
 
     def test_madd_multiple_series(self):
         """Test adding samples to multiple time series in one command"""
-        # Create multiple time series
-        self.client.execute_command('TS.CREATE', 'ts1')
-        self.client.execute_command('TS.CREATE', 'ts2')
+        # Create multiple time series, labelled so both can be verified with a single TS.MRANGE
+        self.client.execute_command('TS.CREATE', 'ts1', 'LABELS', 'batch', 'test_madd_multiple_series')
+        self.client.execute_command('TS.CREATE', 'ts2', 'LABELS', 'batch', 'test_madd_multiple_series')
 
         # Add samples to both time series
         result = self.client.execute_command('TS.MADD',
@@ -42,14 +43,18 @@ class TestTsMadd(ValkeyTimeSeriesTestCaseBase):
         # Verify timestamps
         assert result == [1000, 1000, 2000, 2000]
 
+        result = self.client.execute_command('TS.MRANGE', 0, 3000, 'FILTER', 'batch=test_madd_multiple_series')
+        assert len(result) == 2
+        ranges = {series[0]: series[2] for series in result}
+
         # Check ts1 data
-        range_ts1 = self.client.execute_command('TS.RANGE', 'ts1', 0, 3000)
+        range_ts1 = ranges[b'ts1']
         assert len(range_ts1) == 2
         assert float(range_ts1[0][1]) == 10.0
         assert float(range_ts1[1][1]) == 20.0
 
         # Check ts2 data
-        range_ts2 = self.client.execute_command('TS.RANGE', 'ts2', 0, 3000)
+        range_ts2 = ranges[b'ts2']
         assert len(range_ts2) == 2
         assert float(range_ts2[0][1]) == 100.0
         assert float(range_ts2[1][1]) == 200.0
@@ -85,7 +90,6 @@ class TestTsMadd(ValkeyTimeSeriesTestCaseBase):
                                              'ts_dup', 1000, 20.0,  # Duplicate
                                              'ts_dup', 2000, 30.0)  # New
 
-        print(result)
         # Verify timestamps (should fail for duplicate)
         assert result[0] == b'TSDB: duplicate sample'  # Error code for duplicate timestamp
         assert result[1] == 2000
@@ -144,19 +148,17 @@ class TestTsMadd(ValkeyTimeSeriesTestCaseBase):
 
     def test_madd_large_batch(self):
         """Test adding a large number of samples in one command"""
-        # Create time series
-        self.client.execute_command('TS.CREATE', 'ts_large')
-
         # Prepare a large batch of samples
-        args = ['TS.MADD']
-        expected_timestamps = []
-
-        for i in range(1000):
-            args.extend([f'ts_large', 1000 + i, i * 1.5])
-            expected_timestamps.append(1000 + i)
+        expected_timestamps = list(range(1000, 2000))
+        samples = [('ts_large', ts, (ts - 1000) * 1.5) for ts in expected_timestamps]
+        args = ['TS.MADD', *itertools.chain.from_iterable(samples)]
 
-        # Add all samples at once
-        result = self.client.execute_command(*args)
+        # Create the time series and add all samples at once, atomically (MULTI/EXEC). The larger chunk
+        # size keeps the batch from spilling into new chunks part-way through the MADD
+        pipe = self.client.pipeline(transaction=True)
+        pipe.execute_command('TS.CREATE', 'ts_large', 'CHUNK_SIZE', 16384)
+        pipe.execute_command(*args)
+        _, result = pipe.execute()
 
         # Verify all timestamps were added
         assert len(result) == 1000
@@ -166,33 +168,37 @@ class TestTsMadd(ValkeyTimeSeriesTestCaseBase):
         info = self.ts_info('ts_large')
         assert info['totalSamples'] == 1000
 
-    def test_madd_errors(self):
-        """Test error cases for TS.MADD"""
-        # Create a regular key (not a time series)
-        self.client.execute_command('SET', 'string_key', 'hello')
+        # Verify the stored samples, comparing each column as a whole
+        range_result = self.client.execute_command('TS.RANGE', 'ts_large', '-', '+')
+        assert [ts for ts, _ in range_result] == expected_timestamps
+        assert [float(val) for _, val in range_result] == [val for _, _, val in samples]
 
+    @pytest.mark.parametrize("args,raises,expected_err", [
         # Add with invalid timestamp format
-        with pytest.raises(ResponseError) as execInfo:
-            self.client.execute_command("TS.ADD", "ts_1", "abc", 10.0)
-
-        assert "TSDB: invalid timestamp" in str(execInfo.value)
-
+        (("TS.ADD", "ts_1", "abc", 10.0), True, "TSDB: invalid timestamp"),
         # Add with invalid value format
-        self.client.execute_command('TS.CREATE', 'ts1')
-        res = self.client.execute_command("TS.MADD", "ts1", "1000", "invalid")
-        assert "TSDB: invalid value" in str(res[0])
-
+        (("TS.MADD", "ts1", "1000", "invalid"), False, "TSDB: invalid value"),
         # Add to a regular string key
-        res = self.client.execute_command("TS.MADD", "string_key", "1000", "10.0")
-        assert "TSDB: the key is not a TSDB key" in str(res[0])
-
-        # todo check that NaN and Inf are disallowed
-
+        (("TS.MADD", "string_key", "1000", "10.0"), False, "TSDB: the key is not a TSDB key"),
         # Not enough arguments
-        with pytest.raises(ResponseError) as execInfo:
-            self.client.execute_command("TS.MADD", "ts1", "1000")
+        (("TS.MADD", "ts1", "1000"), True, "wrong number of arguments for 'TS.MADD' command"),
+        # todo check that NaN and Inf are disallowed
+    ])
+    def test_madd_errors(self, args, raises, expected_err):
+        """Test error cases for TS.MADD"""
+        # Create a regular key (not a time series) and a time series
+        self.client.execute_command('SET', 'string_key', 'hello')
+        self.client.execute_command('TS.CREATE', 'ts1')
 
-        assert "wrong number of arguments for 'TS.MADD' command" in str(execInfo.value)
+        if raises:
+            # Command-level errors fail the whole command
+            with pytest.raises(ResponseError) as execInfo:
+                self.client.execute_command(*args)
+            assert expected_err in str(execInfo.value)
+        else:
+            # Per-sample errors are reported in place of the sample's timestamp
+            res = self.client.execute_command(*args)
+            assert expected_err in str(res[0])
 
     def test_madd_with_millisecond_values(self):
         """Test TS.MADD with millisecond timestamp values"""
@@ -9,15 +9,17 @@ class TestTsQueryIndex(ValkeyTimeSeriesTestCaseBase):
 
     def setup_test_data(self, client):
         """Create a set of time series with different label combinations for testing"""
-        # Create test series with various labels
-        client.execute_command('TS.CREATE', 'ts1', 'LABELS', 'name', 'cpu', 'type', 'usage', 'node', 'node1')
-        client.execute_command('TS.CREATE', 'ts2', 'LABELS', 'name', 'cpu', 'type', 'usage', 'node', 'node2')
-        client.execute_command('TS.CREATE', 'ts3', 'LABELS', 'name', 'memory', 'type', 'usage', 'node', 'node1')
-        client.execute_command('TS.CREATE', 'ts4', 'LABELS', 'name', 'memory', 'type', 'usage', 'node', 'node2')
-        client.execute_command('TS.CREATE', 'ts5', 'LABELS', 'name', 'cpu', 'type', 'temperature', 'node', 'node1')
-        client.execute_command('TS.CREATE', 'ts6', 'LABELS', 'name', 'cpu', 'node', 'node3')
-        client.execute_command('TS.CREATE', 'ts7', 'LABELS', 'name', 'disk', 'type', 'usage', 'node', 'node3')
-        client.execute_command('TS.CREATE', 'ts8', 'LABELS', 'type', 'usage')  # No name label
+        with client.pipeline(transaction=False) as pipe:
+            # Create test series with various labels
+            pipe.execute_command('TS.CREATE', 'ts1', 'LABELS', 'name', 'cpu', 'type', 'usage', 'node', 'node1')
+            pipe.execute_command('TS.CREATE', 'ts2', 'LABELS', 'name', 'cpu', 'type', 'usage', 'node', 'node2')
+            pipe.execute_command('TS.CREATE', 'ts3', 'LABELS', 'name', 'memory', 'type', 'usage', 'node', 'node1')
+            pipe.execute_command('TS.CREATE', 'ts4', 'LABELS', 'name', 'memory', 'type', 'usage', 'node', 'node2')
+            pipe.execute_command('TS.CREATE', 'ts5', 'LABELS', 'name', 'cpu', 'type', 'temperature', 'node', 'node1')
+            pipe.execute_command('TS.CREATE', 'ts6', 'LABELS', 'name', 'cpu', 'node', 'node3')
+            pipe.execute_command('TS.CREATE', 'ts7', 'LABELS', 'name', 'disk', 'type', 'usage', 'node', 'node3')
+            pipe.execute_command('TS.CREATE', 'ts8', 'LABELS', 'type', 'usage')  # No name label
+            pipe.execute()
 
     def test_basic_query(self):
         """Test basic TS.QUERYINDEX functionality"""
@@ -157,14 +159,16 @@ class TestTsQueryIndex(ValkeyTimeSeriesTestCaseBase):
         assert result1 == [b'ts1', b'ts2', b'ts5', b'ts6', b'ts7']
 
     def setup_or_test_data(self, client):
-        client.execute_command('TS.CREATE', 'ts1', 'METRIC', 'http_status{status="200",method="GET"}')
-        client.execute_command('TS.CREATE', 'ts2', 'METRIC', 'http_status{status="200",method="POST"}')
-        client.execute_command('TS.CREATE', 'ts3', 'METRIC', 'http_status{status="404",method="GET"}')
-        client.execute_command('TS.CREATE', 'ts4', 'METRIC', 'http_status{status="500",method="POST"}')
-        client.execute_command('TS.CREATE', 'ts5', 'METRIC', 'api_host{name="server1",env="prod"}')
-        client.execute_command('TS.CREATE', 'ts6', 'METRIC', 'api_host{name="server2",env="prod"}')
-        client.execute_command('TS.CREATE', 'ts7', 'METRIC', 'api_host{name="server1",env="staging"}')
-        client.execute_command('TS.CREATE', 'ts8', 'METRIC', 'api_host{name="server2",env="staging"}')
+        with client.pipeline(transaction=False) as pipe:
+            pipe.execute_command('TS.CREATE', 'ts1', 'METRIC', 'http_status{status="200",method="GET"}')
+            pipe.execute_command('TS.CREATE', 'ts2', 'METRIC', 'http_status{status="200",method="POST"}')
+            pipe.execute_command('TS.CREATE', 'ts3', 'METRIC', 'http_status{status="404",method="GET"}')
+            pipe.execute_command('TS.CREATE', 'ts4', 'METRIC', 'http_status{status="500",method="POST"}')
+            pipe.execute_command('TS.CREATE', 'ts5', 'METRIC', 'api_host{name="server1",env="prod"}')
+            pipe.execute_command('TS.CREATE', 'ts6', 'METRIC', 'api_host{name="server2",env="prod"}')
+            pipe.execute_command('TS.CREATE', 'ts7', 'METRIC', 'api_host{name="server1",env="staging"}')
+            pipe.execute_command('TS.CREATE', 'ts8', 'METRIC', 'api_host{name="server2",env="staging"}')
+            pipe.execute()
 
     def test_or_status_200_or_404(self):
         self.setup_or_test_data(self.client)
@@ -230,11 +234,12 @@ class TestTsQueryIndex(ValkeyTimeSeriesTestCaseBase):
         start_ts = 1000
         end_ts = 1000
 
+        args = ['TS.MADD']
         for i in range(20):
             ts = start_ts + (i * 1000)
             end_ts = ts
-            self.client.execute_command('TS.ADD', 'ts9', ts, i * 10)
-            self.client.execute_command('TS.ADD', 'ts11', ts, i * 30)
+            args.extend(['ts9', ts, i * 10, 'ts11', ts, i * 30])
+        self.client.execute_command(*args)
 
         # Query for series with data
         result = self.client.execute_command('TS.QUERYINDEX', 'FILTER_BY_RANGE', start_ts, end_ts, 'name=cpu')
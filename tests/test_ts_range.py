@@ -1,4 +1,5 @@
 import math
+import time
 
 import pytest
 from valkey import ResponseError
@@ -7,57 +8,98 @@ from valkeytestframework.conftest import resource_port_tracker
 from valkey_timeseries_test_case import ValkeyTimeSeriesTestCaseBase
 
 
+# TS.MADD arguments for the ts1 samples loaded by setup_data
+SETUP_DATA_ARGS = (
+    'ts1', 1000, 10.1,
+    'ts1', 2000, 20.2,
+    'ts1', 3000, 30.3,
+    'ts1', 4000, 40.4,
+    'ts1', 5000, 50.5,
+)
+
+# Known values [1, 2, 3, 4, 5, 6] at timestamps 1000, 2000, 3000, 4000, 5000, 6000
+AGGREGATION_DATA_ARGS = tuple(
+    arg for i in range(6) for arg in ('agg_test', (i + 1) * 1000, float(i + 1))
+)
+
+FILTERS_DATA_ARGS = tuple(
+    arg for i in range(0, 1000, 10) for arg in ('ts1', (i + 1) * 1000, 10 + (i * 10))
+)
+
+# FILTER_BY_TS regression harness: accepts at most 128 timestamps per query (MAX_TS_VALUES_FILTER)
+PERF_SAMPLE_COUNT = 100_000
+PERF_MADD_BATCH_SIZE = 10_000
+PERF_FILTER_TIMESTAMPS = tuple(range(1, PERF_SAMPLE_COUNT + 1, PERF_SAMPLE_COUNT // 128))[:128]
+PERF_QUERY_COUNT = 100
+PERF_MAX_SECONDS = 2.0
+
 # TODO: Aggregation and groupby tests are not (yet) implemented in this test case.
 class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
-    def setup_data(self):
-        # Setup some time series data
+    @pytest.fixture
+    def setup_data(self, setup_test):
+        # Setup some time series data; tests reading it opt in with @pytest.mark.usefixtures('setup_data')
         self.client.execute_command('TS.CREATE', 'ts1')
-        self.client.execute_command('TS.ADD', 'ts1', 1000, 10.1)
-        self.client.execute_command('TS.ADD', 'ts1', 2000, 20.2)
-        self.client.execute_command('TS.ADD', 'ts1', 3000, 30.3)
-        self.client.execute_command('TS.ADD', 'ts1', 4000, 40.4)
-        self.client.execute_command('TS.ADD', 'ts1', 5000, 50.5)
+        self.client.execute_command('TS.MADD', *SETUP_DATA_ARGS)
 
+    @pytest.mark.usefixtures('setup_data')
     def test_basic_range(self):
         """Test basic TS.RANGE with start and end timestamps"""
 
-        self.setup_data()
-
         result = self.client.execute_command('TS.RANGE', 'ts1', 2000, 4000)
         assert result == [[2000, b'20.2'], [3000, b'30.3'], [4000, b'40.4']]
 
+    @pytest.mark.usefixtures('setup_data')
     def test_full_range(self):
         """Test TS.RANGE with '-' and '+'"""
 
-        self.setup_data()
-
         result = self.client.execute_command('TS.RANGE', 'ts1', '-', '+')
         assert len(result) == 5
         assert result[0] == [1000, b'10.1']
         assert result[-1] == [5000, b'50.5']
 
+    @pytest.mark.usefixtures('setup_data')
     def test_range_with_count(self):
         """Test TS.RANGE with COUNT option"""
 
-        self.setup_data()
-
         # Forward count
         result = self.client.execute_command('TS.RANGE', 'ts1', '-', '+', 'COUNT', 2)
         assert result == [[1000, b'10.1'], [2000, b'20.2']]
 
+    @pytest.mark.usefixtures('setup_data')
     def test_range_filter_by_ts(self):
         """Test TS.RANGE with FILTER_BY_TS"""
 
-        self.setup_data()
-
         result = self.client.execute_command('TS.RANGE', 'ts1', '-', '+', 'FILTER_BY_TS', 1000, 3000, 5000)
         assert result == [[1000, b'10.1'], [3000, b'30.3'], [5000, b'50.5']]
 
+    @pytest.mark.perf
+    def test_range_filter_by_ts_perf(self):
+        """Test TS.RANGE FILTER_BY_TS on a large series stays within a wall-time budget"""
+
+        self.client.execute_command('TS.CREATE', 'ts_perf')
+        with self.pipe() as pipe:
+            for start in range(1, PERF_SAMPLE_COUNT + 1, PERF_MADD_BATCH_SIZE):
+                pipe.execute_command('TS.MADD', *[
+                    arg
+                    for ts in range(start, start + PERF_MADD_BATCH_SIZE)
+                    for arg in ('ts_perf', ts, ts)
+                ])
+            pipe.execute()
+
+        with self.pipe() as pipe:
+            for _ in range(PERF_QUERY_COUNT):
+                pipe.execute_command('TS.RANGE', 'ts_perf', '-', '+', 'FILTER_BY_TS', *PERF_FILTER_TIMESTAMPS)
+            started = time.perf_counter()
+            results = pipe.execute()
+            elapsed = time.perf_counter() - started
+
+        assert all([ts for ts, _ in result] == list(PERF_FILTER_TIMESTAMPS) for result in results)
+        assert elapsed < PERF_MAX_SECONDS, f"{PERF_QUERY_COUNT} FILTER_BY_TS queries took {elapsed:.3f}s"
+
+    @pytest.mark.usefixtures('setup_data')
     def test_range_filter_single_item(self):
         """Test TS.RANGE with FILTER_BY_TS"""
 
-        self.setup_data()
-
         result = self.client.execute_command('TS.RANGE', 'ts1', '-', '+', 'FILTER_BY_TS', 3000)
         assert result == [[3000, b'30.3']]
 
@@ -68,34 +110,34 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         result = self.client.execute_command('TS.RANGE', 'single', 1000, 1000, 'FILTER_BY_TS', 1000)
         assert result == [[1000, b'10']]
 
+    @pytest.mark.usefixtures('setup_data')
     def test_range_filter_by_value(self):
         """Test TS.RANGE with FILTER_BY_VALUE"""
 
-        self.setup_data()
+        with self.pipe() as pipe:
+            pipe.execute_command('TS.RANGE', 'ts1', '-', '+', 'FILTER_BY_VALUE', 20, 40)
+            # Test inclusive range (using slightly adjusted values)
+            pipe.execute_command('TS.RANGE', 'ts1', '-', '+', 'FILTER_BY_VALUE', 20.2, 40.4)
+            result, inclusive = pipe.execute()
 
-        result = self.client.execute_command('TS.RANGE', 'ts1', '-', '+', 'FILTER_BY_VALUE', 20, 40)
         assert result == [[2000, b'20.2'], [3000, b'30.3']]
         # Note: 40.4 is excluded because the range is min <= value < max
 
-        # Test inclusive range (using slightly adjusted values)
-        result = self.client.execute_command('TS.RANGE', 'ts1', '-', '+', 'FILTER_BY_VALUE', 20.2, 40.4)
-        assert result == [[2000, b'20.2'], [3000, b'30.3'], [4000, b'40.4']]
+        assert inclusive == [[2000, b'20.2'], [3000, b'30.3'], [4000, b'40.4']]
 
+    @pytest.mark.usefixtures('setup_data')
     def test_range_filter_by_ts_and_value(self):
         """Test TS.RANGE combining FILTER_BY_TS and FILTER_BY_VALUE"""
 
-        self.setup_data()
-
         result = self.client.execute_command('TS.RANGE', 'ts1', '-', '+',
                                              'FILTER_BY_TS', 2000, 4000, 5000,
                                              'FILTER_BY_VALUE', 35, 60)
         assert result == [[4000, b'40.4'], [5000, b'50.5']]
 
+    @pytest.mark.usefixtures('setup_data')
     def test_range_aggregation_options(self):
         """Test TS.RANGE aggregation with ALIGN, BUCKETTIMESTAMP, EMPTY"""
 
-        self.setup_data()
-
         # Align to 0, bucket timestamp mid, report empty
         result = self.client.execute_command('TS.RANGE', 'ts1', 500, 5000,
                                              'ALIGN', 0,
@@ -113,11 +155,12 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         """Test TS.RANGE aggregation with ALIGN, BUCKETTIMESTAMP, EMPTY"""
 
         self.client.execute_command('TS.CREATE', 'ts1')
-        self.client.execute_command('TS.ADD', 'ts1', 100, 10)
-        self.client.execute_command('TS.ADD', 'ts1', 110, 20)
-        self.client.execute_command('TS.ADD', 'ts1', 150, 30)
-        self.client.execute_command('TS.ADD', 'ts1', 160, 40)
-        self.client.execute_command('TS.ADD', 'ts1', 200, 50)
+        self.client.execute_command('TS.MADD',
+                                    'ts1', 100, 10,
+                                    'ts1', 110, 20,
+                                    'ts1', 150, 30,
+                                    'ts1', 160, 40,
+                                    'ts1', 200, 50)
 
         # Align to 0, bucket timestamp mid, dont report empty
         result = self.client.execute_command('TS.RANGE', 'ts1', "-", "+",
@@ -146,8 +189,7 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         """Test TS.RANGE combining aggregation and filters"""
 
         self.client.execute_command('TS.CREATE', 'ts1')
-        for i in range(0, 1000, 10):
-            self.client.execute_command('TS.ADD', 'ts1', (i + 1) * 1000, 10 + (i * 10))
+        self.client.execute_command('TS.MADD', *FILTERS_DATA_ARGS)
 
         result = self.client.execute_command('TS.RANGE', 'ts1', '-', '+',
                                              'FILTER_BY_VALUE', 500, 1000,
@@ -160,8 +202,6 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
     def test_range_empty_series(self):
         """Test TS.RANGE on an existing but empty series"""
 
-        self.setup_data()
-
         self.client.execute_command('TS.CREATE', 'ts_empty')
         result = self.client.execute_command('TS.RANGE', 'ts_empty', '-', '+')
         assert result == []
@@ -173,11 +213,9 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
     def test_range_non_existent_series(self):
         """Test TS.RANGE on a non-existent key"""
 
-        with pytest.raises(ResponseError) as excinfo:
+        with pytest.raises(ResponseError, match=r"(?i)key does not exist"):
             self.client.execute_command('TS.RANGE', 'ts_nonexistent', '-', '+')
 
-        assert "key does not exist" in str(excinfo.value).lower()
-
     def test_range_returns_nan_values(self):
         """Test TS.RANGE returns NaN samples without dropping them."""
 
@@ -195,118 +233,11 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         assert result[2] == [3000, b'3']
         assert math.isnan(float(result[3][1])), f"Expected NaN, got {result[3][1]}"
 
-    def setup_aggregation_data(self):
+    @pytest.fixture
+    def setup_aggregation_data(self, setup_test):
         """Setup predictable test data for aggregation tests"""
         self.client.execute_command('TS.CREATE', 'agg_test')
-
-        # Add known values: [1, 2, 3, 4, 5, 6] at timestamps 1000, 2000, 3000, 4000, 5000, 6000
-        values = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
-        for i, value in enumerate(values):
-            self.client.execute_command('TS.ADD', 'agg_test', (i + 1) * 1000, value)
-
-    def test_avg_aggregation(self):
-        """Test AVG aggregation"""
-        self.setup_aggregation_data()
-
-        # Single bucket containing all values [1,2,3,4,5,6] -> avg = 3.5
-        result = self.client.execute_command('TS.RANGE', 'agg_test', '-', '+',
-                                             'AGGREGATION', 'AVG', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(3.5)
-
-        # Two buckets: [1,2,3] and [4,5,6] -> avg = 2.0 and 5.0
-        result = self.client.execute_command('TS.RANGE', 'agg_test', '-', '+',
-                                             'AGGREGATION', 'AVG', 3000, 'ALIGN', 0)
-        assert len(result) == 3
-        assert float(result[0][1]) == pytest.approx(1.5)  # (1+2)/2
-        assert float(result[1][1]) == pytest.approx(4.0)  # (3+4+5)/3
-        assert float(result[2][1]) == pytest.approx(6.0)  # (3+4+5)/3
-
-    def test_sum_aggregation(self):
-        """Test SUM aggregation"""
-        self.setup_aggregation_data()
-
-        # Single bucket: sum of [1,2,3,4,5,6] = 21
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'SUM', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(21.0)
-
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'SUM', 3000, 'ALIGN', 0)
-
-        assert len(result) == 3
-        assert float(result[0][1]) == pytest.approx(3.0)
-        assert float(result[1][1]) == pytest.approx(12.0)
-        assert float(result[2][1]) == pytest.approx(6.0)
-
-    def test_min_aggregation(self):
-        """Test MIN aggregation"""
-        self.setup_aggregation_data()
-
-        # Single bucket: min of [1,2,3,4,5,6] = 1
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'MIN', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(1.0)
-
-        # Two buckets: [1,2,3] and [4,5,6] -> min = 1 and 4
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 1000, 7000,
-                                             'AGGREGATION', 'MIN', 3000, 'ALIGN', 'start')
-        assert len(result) == 2
-        assert float(result[0][1]) == pytest.approx(1.0)
-        assert float(result[1][1]) == pytest.approx(4.0)
-
-    def test_max_aggregation(self):
-        """Test MAX aggregation"""
-        self.setup_aggregation_data()
-
-        # Single bucket: max of [1,2,3,4,5,6] = 6
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'MAX', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(6.0)
-
-        # Two buckets: [1,2,3] and [4,5,6] -> max = 3 and 6
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 1000, 7000,
-                                             'AGGREGATION', 'MAX', 3000, 'ALIGN', '-')
-        assert len(result) == 2
-        assert float(result[0][1]) == pytest.approx(3.0)
-        assert float(result[1][1]) == pytest.approx(6.0)
-
-    def test_count_aggregation(self):
-        """Test COUNT aggregation"""
-        self.setup_aggregation_data()
-
-        # Single bucket: count of [1,2,3,4,5,6] = 6
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'COUNT', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(6.0)
-
-        # Two buckets: [1,2,3] and [4,5,6] -> count = 3 and 3
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 1000, 7000,
-                                             'AGGREGATION', 'COUNT', 3000, 'ALIGN', 'start')
-        assert len(result) == 2
-        assert float(result[0][1]) == pytest.approx(3.0)
-        assert float(result[1][1]) == pytest.approx(3.0)
-
-    def test_first_aggregation(self):
-        """Test FIRST aggregation"""
-        self.setup_aggregation_data()
-
-        # Single bucket: first of [1,2,3,4,5,6] = 1
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'FIRST', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(1.0)
-
-        # Two buckets: [1,2,3] and [4,5,6] -> first = 1 and 4
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 1000, 7000,
-                                             'AGGREGATION', 'FIRST', 3000, 'ALIGN', 'start')
-        assert len(result) == 2
-        assert float(result[0][1]) == pytest.approx(1.0)
-        assert float(result[1][1]) == pytest.approx(4.0)
+        self.client.execute_command('TS.MADD', *AGGREGATION_DATA_ARGS)
 
     def test_increase_aggregation_with_reset(self):
         """
@@ -435,43 +366,6 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         assert result[0][0] == 0
         assert float(result[0][1]) == pytest.approx(25.0)
 
-    def test_last_aggregation(self):
-        """Test LAST aggregation"""
-        self.setup_aggregation_data()
-
-        # Single bucket: last of [1,2,3,4,5,6] = 6
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'LAST', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(6.0)
-
-        # Two buckets: [1,2,3] and [4,5,6] -> last = 3 and 6
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 1000, 7000,
-                                             'AGGREGATION', 'LAST', 3000, 'ALIGN', '-')
-        assert len(result) == 2
-        assert float(result[0][1]) == pytest.approx(3.0)
-        assert float(result[1][1]) == pytest.approx(6.0)
-
-    def test_range_aggregation(self):
-        """Test RANGE aggregation (max - min)"""
-        self.setup_aggregation_data()
-
-        # Single bucket: range of [1,2,3,4,5,6] = 6 - 1 = 5
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 1000, 7000,
-                                             'AGGREGATION', 'RANGE', 7000)
-
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(5.0)
-
-        # Two buckets: [1,2,3] and [4,5,6] -> range = 2 and 2
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 1000, 7000,
-                                             'AGGREGATION', 'RANGE', 3000, 'ALIGN', 'start')
-        print(result)
-
-        assert len(result) == 2
-        assert float(result[0][1]) == pytest.approx(2.0)  # 3-1
-        assert float(result[1][1]) == pytest.approx(2.0)  # 6-4
-
     def test_rate_aggregation(self):
         """
         RATE aggregator integration test.
@@ -495,7 +389,6 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
             'BUCKETTIMESTAMP', 'START'
         )
 
-        print("result:", result)
         assert len(result) == 3
         assert result[0][0] == 0
         assert float(result[0][1]) == pytest.approx(0.0)
@@ -573,55 +466,6 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         assert result[0][0] == 0
         assert math.isnan(float(result[0][1])), f"Expected NaN, got {result[0][1]}"
 
-    def test_std_p_aggregation(self):
-        """Test STD.P aggregation (population standard deviation)"""
-        self.setup_aggregation_data()
-
-        # Single bucket: std.p of [1,2,3,4,5,6]
-        # Population std dev = sqrt(sum((x-mean)^2)/N)
-        # mean = 3.5, variance = ((1-3.5)^2 + (2-3.5)^2 + ... + (6-3.5)^2) / 6
-        # = (6.25 + 2.25 + 0.25 + 0.25 + 2.25 + 6.25) / 6 = 17.5 / 6 ≈ 2.917
-        # std.p = sqrt(2.917) ≈ 1.708
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'STD.P', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(1.708, abs=0.01)
-
-    def test_std_s_aggregation(self):
-        """Test STD.S aggregation (sample standard deviation)"""
-        self.setup_aggregation_data()
-
-        # Single bucket: std.s of [1,2,3,4,5,6]
-        # Sample std dev = sqrt(sum((x-mean)^2)/(N-1))
-        # Using the same variance calculation as above but divided by (N-1)
-        # std.s = sqrt(17.5 / 5) = sqrt(3.5) ≈ 1.871
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'STD.S', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(1.871, abs=0.01)
-
-    def test_var_p_aggregation(self):
-        """Test VAR.P aggregation (population variance)"""
-        self.setup_aggregation_data()
-
-        # Single bucket: var.p of [1,2,3,4,5,6]
-        # Population variance = sum((x-mean)^2)/N = 17.5 / 6 ≈ 2.917
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'VAR.P', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(2.917, abs=0.01)
-
-    def test_var_s_aggregation(self):
-        """Test VAR.S aggregation (sample variance)"""
-        self.setup_aggregation_data()
-
-        # Single bucket: var.s of [1,2,3,4,5,6]
-        # Sample variance = sum((x-mean)^2)/(N-1) = 17.5 / 5 = 3.5
-        result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                             'AGGREGATION', 'VAR.S', 7000)
-        assert len(result) == 1
-        assert float(result[0][1]) == pytest.approx(3.5, abs=0.01)
-
     def test_all_aggregation_all_true_single_bucket(self):
         """
         ALL aggregator: when all samples in the bucket are "true" (non-zero),
@@ -640,7 +484,6 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
             'BUCKETTIMESTAMP', 'START'
         )
 
-        print("All result", result)
         assert len(result) == 1
         assert result[0][0] == 0
         assert float(result[0][1]) == pytest.approx(1.0)
@@ -662,7 +505,6 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
             'BUCKETTIMESTAMP', 'START'
         )
 
-        print("All with zero result", result)
         assert len(result) == 1
         assert result[0][0] == 0
         assert float(result[0][1]) == pytest.approx(0.0)
@@ -985,10 +827,9 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         )
         assert float(result_lt[0][1]) == pytest.approx(2.0)
 
+    @pytest.mark.usefixtures('setup_aggregation_data')
     def test_aggregation_single_value_bucket(self):
         """Test aggregation with buckets containing single values"""
-        self.setup_aggregation_data()
-
         # Use a small bucket size so each contains only one value
         result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
                                              'AGGREGATION', 'AVG', 1000, 'ALIGN', 0)
@@ -998,24 +839,15 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         for i, bucket in enumerate(result):
             assert float(bucket[1]) == pytest.approx(float(i + 1))
 
+    @pytest.mark.usefixtures('setup_aggregation_data')
     def test_aggregation_with_bucket_timestamps(self):
         """Test aggregation with different BUCKETTIMESTAMP options"""
-        self.setup_aggregation_data()
-
-        # Test with START bucket timestamp
-        result_start = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                                   'AGGREGATION', 'SUM', 3000, 'ALIGN', 0,
-                                                   'BUCKETTIMESTAMP', 'START')
-
-        # Test with MID bucket timestamp
-        result_mid = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                                 'AGGREGATION', 'SUM', 3000, 'ALIGN', 0,
-                                                 'BUCKETTIMESTAMP', 'MID')
-
-        # Test with END bucket timestamp
-        result_end = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
-                                                 'AGGREGATION', 'SUM', 3000, 'ALIGN', 0,
-                                                 'BUCKETTIMESTAMP', 'END')
+        with self.pipe() as pipe:
+            for bucket_timestamp in ('START', 'MID', 'END'):
+                pipe.execute_command('TS.RANGE', 'agg_test', 0, 7000,
+                                     'AGGREGATION', 'SUM', 3000, 'ALIGN', 0,
+                                     'BUCKETTIMESTAMP', bucket_timestamp)
+            result_start, result_mid, result_end = pipe.execute()
 
         # Values should be the same, timestamps should differ
         assert len(result_start) == len(result_mid) == len(result_end) == 3
@@ -1035,15 +867,15 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         ('FIRST', 1.0),
         ('LAST', 6.0),
         ('RANGE', 5.0),
-        ('STD.P', 1.708),
-        ('STD.S', 1.871),
-        ('VAR.P', 2.917),
-        ('VAR.S', 3.5),
+        # mean = 3.5, sum((x-mean)^2) = 17.5
+        ('STD.P', 1.708),  # sqrt(17.5 / 6)
+        ('STD.S', 1.871),  # sqrt(17.5 / 5)
+        ('VAR.P', 2.917),  # 17.5 / 6
+        ('VAR.S', 3.5),  # 17.5 / 5
     ])
+    @pytest.mark.usefixtures('setup_aggregation_data')
     def test_all_aggregation_types_parametrized(self, agg_type, expected_single_bucket):
         """Parametrized test for all aggregation types with a single bucket"""
-        self.setup_aggregation_data()
-
         result = self.client.execute_command('TS.RANGE', 'agg_test', 0, 7000,
                                              'AGGREGATION', agg_type, 7000)
 
@@ -1053,6 +885,26 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
         else:
             assert float(result[0][1]) == pytest.approx(expected_single_bucket)
 
+    @pytest.mark.parametrize("agg_type,start,align,expected_buckets", [
+        # ALIGN 0: [1,2], [3,4,5], [6]
+        ('AVG', '-', 0, [1.5, 4.0, 6.0]),
+        ('SUM', 0, 0, [3.0, 12.0, 6.0]),
+        # Aligned to the range start: [1,2,3] and [4,5,6]
+        ('MIN', 1000, 'start', [1.0, 4.0]),
+        ('MAX', 1000, '-', [3.0, 6.0]),
+        ('COUNT', 1000, 'start', [3.0, 3.0]),
+        ('FIRST', 1000, 'start', [1.0, 4.0]),
+        ('LAST', 1000, '-', [3.0, 6.0]),
+        ('RANGE', 1000, 'start', [2.0, 2.0]),
+    ])
+    @pytest.mark.usefixtures('setup_aggregation_data')
+    def test_all_aggregation_types_multiple_buckets(self, agg_type, start, align, expected_buckets):
+        """Parametrized test for aggregation types split across 3000ms buckets"""
+        result = self.client.execute_command('TS.RANGE', 'agg_test', start, 7000,
+                                             'AGGREGATION', agg_type, 3000, 'ALIGN', align)
+
+        assert [float(value) for _, value in result] == pytest.approx(expected_buckets)
+
     def test_none_aggregation_none_match_single_bucket(self):
         """
         NONE aggregator: when *no* samples in the bucket match the condition,
@@ -1291,7 +1143,6 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
             'BUCKETTIMESTAMP', 'START'
         )
 
-        print("Result for", agg_type, result)
         assert len(result) == 1
         assert result[0][0] == 0
 
@@ -1403,26 +1254,25 @@ class TestTimeSeriesRange(ValkeyTimeSeriesTestCaseBase):
                 # each bucket contains one sample (NaN) -> count all = 1, sum=0, count=0, etc.
                 assert actual == pytest.approx(expect_value), f"Unexpected value for {agg_type}"
 
+    @pytest.mark.usefixtures('setup_data')
     def test_range_edge_cases(self):
         """Test TS.RANGE with edge case timestamps"""
 
-        self.setup_data()
-
-        # Exact start/end match
-        result = self.client.execute_command('TS.RANGE', 'ts1', 2000, 2000)
-        assert result == [[2000, b'20.2']]
-
-        # Range before first sample
-        result = self.client.execute_command('TS.RANGE', 'ts1', 0, 500)
-        assert result == []
-
-        # Range after the last sample
-        result = self.client.execute_command('TS.RANGE', 'ts1', 6000, 7000)
-        assert result == []
-
-        # Range partially overlapping
-        result = self.client.execute_command('TS.RANGE', 'ts1', 4500, 5500)
-        assert result == [[5000, b'50.5']]
+        with self.pipe() as pipe:
+            # Exact start/end match
+            pipe.execute_command('TS.RANGE', 'ts1', 2000, 2000)
+            # Range before first sample
+            pipe.execute_command('TS.RANGE', 'ts1', 0, 500)
+            # Range after the last sample
+            pipe.execute_command('TS.RANGE', 'ts1', 6000, 7000)
+            # Range partially overlapping
+            pipe.execute_command('TS.RANGE', 'ts1', 4500, 5500)
+            exact, before, after, overlapping = pipe.execute()
+
+        assert exact == [[2000, b'20.2']]
+        assert before == []
+        assert after == []
+        assert overlapping == [[5000, b'50.5']]
 
     def test_range_error_handling(self):
         """Test error conditions for TS.RANGE"""
@@ -184,7 +184,6 @@ class TestTimeSeriesReplication(ReplicationTestCase):
         info = replica.execute_command(f"TS.INFO {source_key}")
         info_dict = parse_info_response(info)
 
-        assert "rules" in info_dict
         assert len(info_dict["rules"]) == 1
 
         rule = info_dict["rules"][0]
@@ -338,5 +337,5 @@ class TestTimeSeriesReplication(ReplicationTestCase):
         # Verify rule deletion on replicas
         info = replica_client.execute_command(f"TS.INFO {source_key}")
         info_dict = parse_info_response(info)
-        # Rules should be empty or not present
-        assert "rules" not in info_dict or len(info_dict["rules"]) == 0
+        # Rules should be empty
+        assert info_dict["rules"] == []
@@ -206,10 +206,12 @@ class ValkeyTimeSeriesTestCaseCommon(ValkeyTestCase):
         random_string = ''.join(random.choice(characters) for _ in range(length))
         return random_string
 
-    def ts_info(self, key, debug = False):
-        """ Get the info of the given key.
+    def ts_info(self, key, debug = False, chunk_count = None):
+        """ Get the info of the given key. With debug, chunk_count limits the number of chunks reported.
         """
         debug_str = 'DEBUG' if debug else ''
+        if debug and chunk_count is not None:
+            debug_str += f' COUNT {chunk_count}'
         info = self.client.execute_command(f'TS.INFO {key} {debug_str}')
         info_dict = parse_info_response(info)
 
@@ -289,13 +291,24 @@ class ValkeyTimeSeriesTestCaseBase(ValkeyTimeSeriesTestCaseCommon):
         server_path = VALKEY_SERVER_PATH
 
         self.server, self.client = self.create_server(testdir = self.testdir, server_path=server_path, args=args)
+        # Decodes replies to str at parse time. Connects lazily, so tests that don't use it pay nothing.
+        self.str_client = Valkey(host=self.server.bind_ip, port=self.server.port, decode_responses=True)
         logging.info("startup args are: %s", args)
+        yield
+
+        self.str_client.close()
+
+    def pipe(self):
+        """ Return a non-transactional pipeline on the test client, so that a sequence of independent
+        commands is sent in a single round-trip.
+        """
+        return self.client.pipeline(transaction=False)
 
     def validate_rules(self, key, expected_rules: List[CompactionRule], check_dest: bool = True):
         """ Validate the compaction rules of the timeseries.
         """
         info_dict = self.ts_info(key)
-        if 'rules' not in info_dict:
+        if not info_dict['rules']:
             assert len(expected_rules) == 0, f"Expected no rules, but got {len(expected_rules)} rules: {expected_rules}"
             return
 